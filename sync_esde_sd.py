@@ -31,23 +31,64 @@ from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
 import json
 import os
-import re
+import pickle
 import shutil
 import sys
-from copy import deepcopy
+from bisect import bisect_left
+from collections.abc import Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from difflib import get_close_matches
+from functools import lru_cache
 from pathlib import Path
 import xml.etree.ElementTree as ET
 
+try:
+    from lxml import etree as LET  # optional: faster streaming parse/write of large gamelists
+except ImportError:
+    LET = None
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process  # optional: faster --audit_suggest lookups
+except ImportError:
+    fuzz = fuzz_process = None
+
 
 MEDIA_CATEGORIES_ALL = [
     "3dboxes", "backcovers", "covers", "custom", "fanart", "manuals", "marquees",
     "miximages", "physicalmedia", "screenshots", "titlescreens", "videos"
 ]
+MEDIA_CATEGORIES_SET = frozenset(MEDIA_CATEGORIES_ALL)  # O(1) membership on hot paths
+
+# Windows before Python 3.12 has no native CopyFile2 in shutil.copy2, so media copies
+# (NAS over SMB -> SD) use large chunks: fewer SMB round-trips and SD write calls
+USE_BUFFERED_COPY = sys.platform == "win32" and sys.version_info < (3, 12)
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# On-disk cache of NAS media folder listings (see build_media_index)
+MEDIA_INDEX_CACHE_DIR = Path.home() / ".cache" / "esde_sync"
+MEDIA_INDEX_CACHE_VERSION = 1
+
+# Media copies are independent and I/O-bound, so a thread pool hides NAS latency
+COPY_WORKERS = 8
+
+
+class _LooseStemTable(dict):
+    # str.translate table for normalize_stem_loose: keep a-z, 0-9 and whitespace, map the rest to " "
+    # Filled lazily so non-ASCII characters are handled the same way as the old [^a-z0-9\s] regex
+    def __missing__(self, codepoint: int) -> int | str:
+        ch = chr(codepoint)
+        keep = ("a" <= ch <= "z") or ("0" <= ch <= "9") or ch.isspace()
+        value = codepoint if keep else " "
+        self[codepoint] = value
+        return value
+
+
+_LOOSE_STEM_TABLE = _LooseStemTable()
 
 
 @dataclass
@@ -82,12 +123,13 @@ def load_json(path: Path) -> dict:
         return json.load(f)
 
 
+@lru_cache(maxsize=65536)
 def normalize_rom_filename_from_xml(path_text: str) -> str:
     # Convert gamelist <path> like "./Celeste.xci" to "Celeste.xci" (lowercase)
     p = path_text.strip().replace("\\", "/")  # normalize slashes
     if p.startswith("./"):
         p = p[2:]  # strip leading "./"
-    return Path(p).name.lower()  # keep only filename, case-insensitive
+    return p.rstrip("/").rsplit("/", 1)[-1].lower()  # keep only filename, case-insensitive
 
 
 def normalize_stem_loose(stem: str) -> str:
@@ -97,17 +139,37 @@ def normalize_stem_loose(stem: str) -> str:
     - remove punctuation
     - collapse whitespace
     """
-    s = stem.lower()
-    s = re.sub(r"[^a-z0-9\s]+", " ", s)   # replace punctuation with spaces
-    s = re.sub(r"\s+", " ", s).strip()   # collapse spaces
-    return s
+    s = stem.lower().translate(_LOOSE_STEM_TABLE)  # replace punctuation with spaces
+    return " ".join(s.split())                     # collapse spaces
+
 
+def file_stem(name: str) -> str:
+    # Same as Path(name).stem without building a Path (hot path for large media folders)
+    stem, dot, _ = name.rpartition(".")
+    return stem if dot and stem else name
 
-def iter_rom_files(rom_dir: Path) -> set[str]:
+
+def iter_rom_files(rom_dir: Path) -> dict[str, tuple[str, str]]:
     # Gather all ROM filenames in a system directory (recursive), case-insensitive
+    # Maps filename -> (lowercased stem, normalized stem) so callers never recompute them per game
+    # os.scandir reuses the dirent type, avoiding a stat() per entry (slow on SD/NAS)
     if not rom_dir.exists():
-        return set()
-    return {p.name.lower() for p in rom_dir.rglob("*") if p.is_file()}
+        return {}
+    names: set[str] = set()
+    pending = [str(rom_dir)]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):  # like rglob: do not descend into symlinked dirs
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    names.add(entry.name.lower())
+
+    roms: dict[str, tuple[str, str]] = {}
+    for name in names:
+        stem = file_stem(name)
+        roms[name] = (stem, normalize_stem_loose(stem))
+    return roms
 
 
 def ensure_dir(path: Path, dry_run: bool) -> None:
@@ -129,32 +191,88 @@ def backup_file(path: Path, dry_run: bool) -> None:
     shutil.copy2(path, backup_path)
 
 
-def build_media_index(category_dir: Path, fuzzy: bool) -> tuple[dict[str, list[Path]], dict[str, list[Path]], int]:
+def build_media_index(category_dir: Path, fuzzy: bool, rescan: bool = False) -> tuple[dict[str, list[Path]], dict[str, list[Path]], int]:
     """
     Build indexes for fast lookup:
       exact_idx: key = lowercased stem, value = list of files with that stem
       norm_idx : key = normalized stem (punctuation removed), value = list of files
     Also returns total file count in this category directory.
+
+    The folder listing is cached on disk keyed by the folder's mtime, so an
+    unchanged NAS category costs one stat instead of a full directory scan.
+    rescan=True ignores the cached listing (SMB clients and some NAS filesystems
+    report stale folder mtimes) and refreshes the cache from a full scan.
     """
+    try:
+        mtime_ns = os.stat(category_dir).st_mtime_ns
+    except OSError:
+        return {}, {}, 0
+
+    cache_path = media_index_cache_path(category_dir)
+    names = None if rescan else load_media_index_cache(cache_path, mtime_ns)
+    if names is None:
+        names = scan_media_names(category_dir)
+        save_media_index_cache(cache_path, mtime_ns, names)
+
     exact_idx: dict[str, list[Path]] = {}
     norm_idx: dict[str, list[Path]] = {}
-    total_files = 0
 
-    if not category_dir.exists():
-        return exact_idx, norm_idx, 0
-
-    for f in category_dir.iterdir():
-        if not f.is_file():
-            continue
-        total_files += 1
-        key = f.stem.lower()
-        exact_idx.setdefault(key, []).append(f)
+    for name in names:
+        f = category_dir / name
+        stem = file_stem(name)
+        exact_idx.setdefault(stem.lower(), []).append(f)
 
         if fuzzy:
-            nkey = normalize_stem_loose(f.stem)
+            nkey = normalize_stem_loose(stem)
             norm_idx.setdefault(nkey, []).append(f)
 
-    return exact_idx, norm_idx, total_files
+    return exact_idx, norm_idx, len(names)
+
+
+def prefix_matches(exact_idx: dict[str, list[Path]], sorted_keys: list[str], prefix: str) -> list[Path]:
+    # Files whose stem starts with prefix; sorted_keys = sorted(exact_idx), so this is a range scan
+    matches: list[Path] = []
+    i = bisect_left(sorted_keys, prefix)
+    while i < len(sorted_keys) and sorted_keys[i].startswith(prefix):
+        matches.extend(exact_idx[sorted_keys[i]])
+        i += 1
+    return matches
+
+
+def scan_media_names(category_dir: Path) -> list[str]:
+    # List file names in a media category folder (non-recursive)
+    with os.scandir(category_dir) as it:
+        return [entry.name for entry in it if entry.is_file()]
+
+
+def media_index_cache_path(category_dir: Path) -> Path:
+    # One cache file per category folder (absolute path, so cwd does not matter)
+    digest = hashlib.sha1(os.path.abspath(category_dir).encode("utf-8")).hexdigest()
+    return MEDIA_INDEX_CACHE_DIR / f"idx-{digest}.pkl"
+
+
+def load_media_index_cache(cache_path: Path, mtime_ns: int) -> list[str] | None:
+    # Return cached file names if the cache matches the folder's current mtime
+    try:
+        with cache_path.open("rb") as f:
+            version, cached_mtime_ns, names = pickle.load(f)
+    except Exception:
+        return None  # missing/corrupt cache just means a rescan
+    if version != MEDIA_INDEX_CACHE_VERSION or cached_mtime_ns != mtime_ns:
+        return None
+    return names
+
+
+def save_media_index_cache(cache_path: Path, mtime_ns: int, names: list[str]) -> None:
+    # Best effort: a read-only or full home drive must not break the sync
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump((MEDIA_INDEX_CACHE_VERSION, mtime_ns, names), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
 
 def copy_file(src: Path, dst: Path, dry_run: bool) -> str:
@@ -164,86 +282,166 @@ def copy_file(src: Path, dst: Path, dry_run: bool) -> str:
     """
     ensure_dir(dst.parent, dry_run)
 
-    if dst.exists() and src.exists():
-        try:
-            if dst.stat().st_size == src.stat().st_size:
-                return "skipped"
-        except OSError:
-            pass
+    # One stat per side (dst first: it is local and usually decides); missing files raise
+    try:
+        if os.stat(dst).st_size == os.stat(src).st_size:
+            return "skipped"
+    except OSError:
+        pass
 
     if dry_run:
         print(f"[DRY] copy: {src} -> {dst}")
         return "copied"
 
-    shutil.copy2(src, dst)
+    if USE_BUFFERED_COPY:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
     return "copied"
 
 
-def parse_category_from_media_ref(text: str, system: str) -> str | None:
+def copy_files(pairs: list[tuple[Path, Path]]) -> list[str]:
+    """
+    Copy many (src, dst) pairs with copy_file in parallel (real runs only; dry runs copy inline).
+    Returns one copy_file result per pair, in the same order.
+    """
+    if len(pairs) < 2:
+        return [copy_file(src, dst, False) for src, dst in pairs]
+
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as ex:
+        return list(ex.map(lambda pair: copy_file(pair[0], pair[1], False), pairs))
+
+
+def parse_category_from_media_ref(t: str, system_lower: str) -> str | None:
     """
     Try to infer category from a media reference path inside gamelist.xml.
     Example refs often look like:
       ./downloaded_media/switch/covers/Celeste.png
+    t must already be stripped, "/"-separated and lowercased (see expected_categories_from_game_xml);
+    system_lower is the system folder name, already lowercased by the caller.
     """
-    if not text:
+    if not t:
         return None
-
-    t = text.strip().replace("\\", "/")
     parts = [p for p in t.split("/") if p and p != "."]
 
     # Case 1: .../downloaded_media/<system>/<category>/...
     if "downloaded_media" in parts:
         i = parts.index("downloaded_media")
-        if i + 2 < len(parts) and parts[i + 1].lower() == system.lower():
-            cat = parts[i + 2].lower()
-            return cat if cat in MEDIA_CATEGORIES_ALL else None
+        if i + 2 < len(parts) and parts[i + 1] == system_lower:
+            cat = parts[i + 2]
+            return cat if cat in MEDIA_CATEGORIES_SET else None
 
     # Case 2: .../<system>/<category>/...
-    lowered = [p.lower() for p in parts]
-    if system.lower() in lowered:
-        i = lowered.index(system.lower())
-        if i + 1 < len(lowered):
-            cat = lowered[i + 1]
-            return cat if cat in MEDIA_CATEGORIES_ALL else None
+    if system_lower in parts:
+        i = parts.index(system_lower)
+        if i + 1 < len(parts):
+            cat = parts[i + 1]
+            return cat if cat in MEDIA_CATEGORIES_SET else None
 
     # Case 3: contains a known category segment somewhere
-    for p in lowered:
-        if p in MEDIA_CATEGORIES_ALL:
+    for p in parts:
+        if p in MEDIA_CATEGORIES_SET:
             return p
 
     return None
 
 
-def expected_categories_from_game_xml(game: ET.Element, system: str, selected_categories: list[str]) -> set[str]:
+def expected_categories_from_game_xml(game: ET.Element, system_lower: str, selected_categories: Collection[str]) -> set[str]:
     """
     If the <game> entry contains media references, infer which categories are expected for THIS ROM.
     If none can be inferred, returns empty set.
+    Called per game: pass system_lower precomputed and selected_categories as a (frozen)set.
     """
     expected: set[str] = set()
-
-    for child in list(game):
-        if child is None or child.text is None:
-            continue
-        txt = child.text.strip()
-        if not txt:
+    if not selected_categories:
+        return expected
+
+    # Single pass: each child text is normalized once, and we stop once every category is found
+    for child in game:
+        if child.text is None or not isinstance(child.tag, str):
+            continue  # lxml also yields comments/PIs as children
+        t = child.text.strip().replace("\\", "/").lower()
+        if not t:
             continue
 
-        if ("downloaded_media" not in txt.replace("\\", "/")) and not any(c in txt.lower() for c in MEDIA_CATEGORIES_ALL):
+        # A ref can only yield a category that appears in it as a path segment
+        if not any(c in t for c in selected_categories):
             continue
 
-        cat = parse_category_from_media_ref(txt, system)
-        if cat and cat in selected_categories:
+        cat = parse_category_from_media_ref(t, system_lower)
+        if cat in selected_categories:
             expected.add(cat)
+            if len(expected) == len(selected_categories):
+                break
 
     return expected
 
 
+def iter_gamelist_entries(gamelist: Path) -> Iterator[ET.Element]:
+    """
+    Stream the top-level <provider> and <game> elements of a gamelist.xml.
+    Each element is released once the caller moves on (keeps memory flat on big
+    master gamelists). To keep one, append it to another tree; no copy is needed on
+    either backend (stdlib drops the parser's reference, lxml moves the node).
+    """
+    with gamelist.open("rb") as f:
+        if LET is not None:
+            for _, elem in LET.iterparse(f, events=("end",), tag=("game", "provider")):
+                parent = elem.getparent()
+                if parent is None or parent.getparent() is not None:
+                    continue  # only direct children of <gameList>
+                # Drop entries already handed out before yielding, so a caller may move elem
+                # into its own tree; siblings after it may already be parsed and must stay
+                while elem.getprevious() is not None:
+                    del parent[0]
+                yield elem
+                if elem.getparent() is parent:
+                    elem.clear()  # not kept by the caller; removed with the next entry
+            return
+
+        root = None
+        depth = 0
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1 and elem.tag in ("game", "provider"):
+                yield elem
+                root.clear()  # drop the parser's reference; kept elements live on in the caller's tree
+
+
+def write_gamelist(root: ET.Element, out_path: Path) -> None:
+    """
+    Write a <gameList> to disk atomically: serialize to a temp file next to the
+    target, then swap it in, so a pulled SD card never leaves a half-written gamelist.
+    Uses lxml's (much faster) serializer when root is an lxml element.
+    """
+    tmp_path = out_path.with_name(f"{out_path.name}.tmp")
+    try:
+        if LET is not None and LET.iselement(root):
+            LET.ElementTree(root).write(str(tmp_path), encoding="utf-8", xml_declaration=True, pretty_print=False)
+        else:
+            ET.ElementTree(root).write(tmp_path, encoding="utf-8", xml_declaration=True)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def suggest_closest_stem(target_stem: str, available_stems: list[str]) -> str | None:
     """
     Suggest a closest stem when mismatch likely.
     """
     if not available_stems:
         return None
+    if fuzz_process is not None:
+        best = fuzz_process.extractOne(target_stem, available_stems, scorer=fuzz.ratio, score_cutoff=80)
+        return best[0] if best else None
     matches = get_close_matches(target_stem, available_stems, n=1, cutoff=0.80)
     return matches[0] if matches else None
 
@@ -253,7 +451,9 @@ def list_sd_systems(sd_root: Path) -> list[str]:
     roms_root = sd_root / "ROMs"
     if not roms_root.exists():
         return []
-    return sorted([p.name for p in roms_root.iterdir() if p.is_dir()])
+    with os.scandir(roms_root) as it:
+        # is_dir() answers from the dirent; it only stats symlinks (kept, as before)
+        return sorted(e.name for e in it if e.is_dir())
 
 
 def validate_sd_root(sd_root: Path) -> None:
@@ -278,7 +478,7 @@ def resolve_media_categories(args) -> list[str]:
         else:
             media_categories = [m for m in MEDIA_CATEGORIES_ALL if m != "videos"]
 
-    invalid = [m for m in media_categories if m not in MEDIA_CATEGORIES_ALL]
+    invalid = [m for m in media_categories if m not in MEDIA_CATEGORIES_SET]
     if invalid:
         raise SystemExit(f"Invalid media categories: {invalid}. Valid: {MEDIA_CATEGORIES_ALL}")
 
@@ -301,6 +501,7 @@ def audit_missing_master(
     systems: list[str],
     media_categories_selected: list[str],
     fuzzy_media_match: bool,
+    rescan_media: bool,
     audit_suggest: bool,
     audit_csv: str | None
 ) -> int:
@@ -316,7 +517,8 @@ def audit_missing_master(
 
     for system in systems:
         sd_rom_dir = sd_root / "ROMs" / system
-        sd_rom_files = sorted(iter_rom_files(sd_rom_dir))
+        sd_roms = iter_rom_files(sd_rom_dir)
+        sd_rom_files = sorted(sd_roms)
         if not sd_rom_files:
             continue
 
@@ -334,17 +536,6 @@ def audit_missing_master(
             print(f"Missing from master gamelist: {len(sd_rom_files)}")
             continue
 
-        # Parse master gamelist and map ROM filename -> <game> element
-        tree = ET.parse(nas_gamelist)
-        root = tree.getroot()
-        master_games = root.findall("game")
-        master_map: dict[str, ET.Element] = {}
-        for game in master_games:
-            p = game.find("path")
-            if p is None or not p.text:
-                continue
-            master_map[normalize_rom_filename_from_xml(p.text)] = game
-
         present_in_master = 0
         missing_in_master = 0
 
@@ -352,12 +543,15 @@ def audit_missing_master(
         effective_categories: list[str] = []
         cat_exact_idx: dict[str, dict[str, list[Path]]] = {}
         cat_norm_idx: dict[str, dict[str, list[Path]]] = {}
+        cat_sorted_keys: dict[str, list[str]] = {}
         ignored = 0
 
         for cat in media_categories_selected:
-            exact_idx, norm_idx, total = build_media_index(nas_media_root / cat, fuzzy=fuzzy_media_match)
+            exact_idx, norm_idx, total = build_media_index(nas_media_root / cat, fuzzy=fuzzy_media_match, rescan=rescan_media)
             cat_exact_idx[cat] = exact_idx
             cat_norm_idx[cat] = norm_idx
+            if fuzzy_media_match:
+                cat_sorted_keys[cat] = sorted(exact_idx)
 
             if total > 0:
                 effective_categories.append(cat)
@@ -368,11 +562,27 @@ def audit_missing_master(
         print(f"Effective categories        : {', '.join(effective_categories) if effective_categories else '(none)'}")
         print(f"Categories ignored (empty)  : {ignored}")
 
+        effective_set = frozenset(effective_categories)  # membership checks per game
+        system_lower = system.lower()
+
+        # Single streaming pass: map ROM filename -> categories its <game> references
+        # Only ROMs present on SD are indexed; every element is cleared as soon as it is read
+        master_map: dict[str, set[str]] = {}
+        for game in iter_gamelist_entries(nas_gamelist):
+            if game.tag != "game":
+                continue
+            p = game.find("path")
+            if p is None or not p.text:
+                continue
+            rom = normalize_rom_filename_from_xml(p.text)
+            if rom in sd_roms:
+                master_map[rom] = expected_categories_from_game_xml(game, system_lower, effective_set)
+
         # Audit per ROM on SD
         missing_media_count = 0
         for rom in sd_rom_files:
-            game = master_map.get(rom)
-            if game is None:
+            expected_from_xml = master_map.get(rom)
+            if expected_from_xml is None:
                 missing_in_master += 1
                 all_items.append(AuditItem(system, rom, False, [], "ROM not found in master gamelist.xml"))
                 continue
@@ -380,11 +590,9 @@ def audit_missing_master(
             present_in_master += 1
 
             # Determine expected categories for this ROM
-            expected_from_xml = expected_categories_from_game_xml(game, system, effective_categories)
             expected_categories = sorted(expected_from_xml) if expected_from_xml else list(effective_categories)
 
-            rom_stem = Path(rom).stem.lower()
-            rom_stem_norm = normalize_stem_loose(rom_stem)
+            rom_stem, rom_stem_norm = sd_roms[rom]
 
             missing_cats: list[str] = []
             for cat in expected_categories:
@@ -397,9 +605,7 @@ def audit_missing_master(
                 if not matches and fuzzy_media_match:
                     matches.extend(cat_norm_idx.get(cat, {}).get(rom_stem_norm, []))
                     if not matches:
-                        for k, files in cat_exact_idx.get(cat, {}).items():
-                            if k.startswith(rom_stem):
-                                matches.extend(files)
+                        matches.extend(prefix_matches(cat_exact_idx.get(cat, {}), cat_sorted_keys.get(cat, []), rom_stem))
 
                 if not matches:
                     missing_cats.append(cat)
@@ -432,19 +638,21 @@ def audit_missing_master(
     if audit_csv:
         out = Path(audit_csv)
         out.parent.mkdir(parents=True, exist_ok=True)
-        with out.open("w", newline="", encoding="utf-8") as f:
+        with out.open("w", newline="", encoding="utf-8", buffering=1024 * 1024) as f:
             w = csv.writer(f)
             w.writerow(["system", "rom_filename", "in_master_gamelist", "missing_categories", "note"])
-            for item in all_items:
-                # Only write rows that actually represent a problem
-                if (not item.in_master_gamelist) or item.missing_categories:
-                    w.writerow([
-                        item.system,
-                        item.rom_filename,
-                        "yes" if item.in_master_gamelist else "no",
-                        ",".join(item.missing_categories),
-                        item.note
-                    ])
+            # Single streamed pass; only rows that actually represent a problem
+            w.writerows(
+                [
+                    item.system,
+                    item.rom_filename,
+                    "yes" if item.in_master_gamelist else "no",
+                    ",".join(item.missing_categories),
+                    item.note
+                ]
+                for item in all_items
+                if (not item.in_master_gamelist) or item.missing_categories
+            )
         print(f"\n[OK] Wrote audit CSV: {out}")
 
     # Return non-zero if problems exist (useful for automation)
@@ -465,6 +673,7 @@ def filter_gamelist_and_sync_media(
     dry_run: bool,
     backup_gamelist_flag: bool,
     fuzzy_media_match: bool,
+    rescan_media: bool,
     report: bool,
     stats: RunStats
 ) -> None:
@@ -481,44 +690,51 @@ def filter_gamelist_and_sync_media(
         print(f"[WARN] Missing master gamelist for system '{system}': {nas_gamelist}")
         return
 
-    rom_filenames = iter_rom_files(sd_rom_dir)
+    rom_filenames = iter_rom_files(sd_rom_dir)  # filename -> (stem, normalized stem)
     if not rom_filenames:
         print(f"[INFO] No ROMs found for system '{system}' at: {sd_rom_dir}")
         return
 
-    # Parse master gamelist.xml
-    tree = ET.parse(nas_gamelist)
-    root = tree.getroot()
-
-    # Preserve <provider> if present
-    provider = root.find("provider")
-
-    # Build new <gameList> root
-    new_root = ET.Element("gameList")
-    if provider is not None:
-        new_root.append(deepcopy(provider))
+    # Build new <gameList> root (same XML backend that streams the master gamelist)
+    xml_impl = LET if LET is not None else ET
+    new_root = xml_impl.Element("gameList")
 
     # Build indexes per category; also prune categories that are missing/empty on NAS
     cat_exact_idx: dict[str, dict[str, list[Path]]] = {}
     cat_norm_idx: dict[str, dict[str, list[Path]]] = {}
+    cat_sorted_keys: dict[str, list[str]] = {}
     effective_categories: list[str] = []
 
     for cat in media_categories:
-        exact_idx, norm_idx, total_files = build_media_index(nas_media_root / cat, fuzzy=fuzzy_media_match)
+        exact_idx, norm_idx, total_files = build_media_index(nas_media_root / cat, fuzzy=fuzzy_media_match, rescan=rescan_media)
         cat_exact_idx[cat] = exact_idx
         cat_norm_idx[cat] = norm_idx
+        if fuzzy_media_match:
+            cat_sorted_keys[cat] = sorted(exact_idx)  # for prefix range lookups
 
         if total_files > 0:
             effective_categories.append(cat)
         else:
             stats.categories_ignored_empty_or_missing += 1
 
-    # Filter games and sync media
-    master_games = root.findall("game")
-    stats.games_total_in_master += len(master_games)
+    effective_set = frozenset(effective_categories)  # membership checks per game
+    system_lower = system.lower()
 
+    # Stream master gamelist.xml; filter games and sync media (real copies are queued)
     kept = 0
-    for game in master_games:
+    copy_pairs: list[tuple[Path, Path]] = []
+    queued_dsts: set[Path] = set()
+    provider_seen = False
+    for game in iter_gamelist_entries(nas_gamelist):
+        if game.tag == "provider":
+            # Preserve the first <provider> at the top of the new gameList
+            if not provider_seen:
+                new_root.insert(0, game)
+                provider_seen = True
+            continue
+
+        stats.games_total_in_master += 1
+
         path_el = game.find("path")
         if path_el is None or not path_el.text:
             continue
@@ -530,11 +746,10 @@ def filter_gamelist_and_sync_media(
         kept += 1
         stats.games_kept += 1
 
-        rom_stem = Path(rom_filename).stem.lower()
-        rom_stem_norm = normalize_stem_loose(rom_stem)
+        rom_stem, rom_stem_norm = rom_filenames[rom_filename]
 
         # Determine which categories are EXPECTED for this ROM
-        expected_from_xml = expected_categories_from_game_xml(game, system, effective_categories)
+        expected_from_xml = expected_categories_from_game_xml(game, system_lower, effective_set)
         expected_categories = sorted(expected_from_xml) if expected_from_xml else list(effective_categories)
 
         matched_cats: list[str] = []
@@ -553,25 +768,31 @@ def filter_gamelist_and_sync_media(
             if not matches and fuzzy_media_match:
                 matches.extend(cat_norm_idx.get(cat, {}).get(rom_stem_norm, []))
                 if not matches:
-                    for k, files in cat_exact_idx.get(cat, {}).items():
-                        if k.startswith(rom_stem):
-                            matches.extend(files)
+                    matches.extend(prefix_matches(cat_exact_idx.get(cat, {}), cat_sorted_keys.get(cat, []), rom_stem))
 
             if matches:
                 matched_cats.append(cat)
                 for src in matches:
                     dst = sd_out_media_root / cat / src.name
-                    result = copy_file(src, dst, dry_run)
-                    if result == "copied":
-                        stats.media_files_copied += 1
-                    else:
+                    if dry_run:
+                        # Inline, so [DRY] copy lines print next to the ROM they belong to
+                        if copy_file(src, dst, dry_run) == "copied":
+                            stats.media_files_copied += 1
+                        else:
+                            stats.media_files_skipped += 1
+                        continue
+                    if dst in queued_dsts:
+                        # Same file matched by another ROM; a second copy would be skipped anyway
                         stats.media_files_skipped += 1
+                        continue
+                    queued_dsts.add(dst)
+                    copy_pairs.append((src, dst))
             else:
                 missed_cats.append(cat)
                 stats.media_categories_missing += 1
 
-        # Append game node into new XML
-        new_root.append(deepcopy(game))
+        # Move game node into new XML (no copy, see iter_gamelist_entries)
+        new_root.append(game)
 
         # Optional per-ROM report
         if report:
@@ -580,6 +801,13 @@ def filter_gamelist_and_sync_media(
             print(f"  matched: {', '.join(matched_cats) if matched_cats else '(none)'}")
             print(f"  missed : {', '.join(missed_cats) if missed_cats else '(none)'}")
 
+    # Copy queued media (parallel; each destination queued once; empty on dry runs)
+    for result in copy_files(copy_pairs):
+        if result == "copied":
+            stats.media_files_copied += 1
+        else:
+            stats.media_files_skipped += 1
+
     # Write filtered gamelist to SD (skip write if 0 kept)
     if kept == 0:
         print(f"[INFO] System '{system}': 0 matching games found; skipping gamelist write.")
@@ -593,8 +821,7 @@ def filter_gamelist_and_sync_media(
     if dry_run:
         print(f"[DRY] write gamelist: {sd_out_gamelist} (kept {kept} games)")
     else:
-        out_tree = ET.ElementTree(new_root)
-        out_tree.write(sd_out_gamelist, encoding="utf-8", xml_declaration=True)
+        write_gamelist(new_root, sd_out_gamelist)
         stats.gamelists_written += 1
 
     stats.systems_processed += 1
@@ -615,6 +842,9 @@ def main() -> int:
     # Optional fuzzy matching
     ap.add_argument("--fuzzy_media_match", action="store_true", help="Enable normalized + prefix fallback media matching")
 
+    # NAS media folder listings are cached (~/.cache/esde_sync) and reused while a folder's mtime is unchanged
+    ap.add_argument("--rescan_media", action="store_true", help="Ignore cached NAS media folder listings and rescan (use if new NAS media is not picked up)")
+
     # Report mode (normal sync)
     ap.add_argument("--report", action="store_true", help="Print per-ROM matched/missed categories")
 
@@ -650,6 +880,7 @@ def main() -> int:
             systems=systems,
             media_categories_selected=media_categories,
             fuzzy_media_match=args.fuzzy_media_match,
+            rescan_media=args.rescan_media,
             audit_suggest=args.audit_suggest,
             audit_csv=audit_csv
         )
@@ -665,6 +896,7 @@ def main() -> int:
     print(f"Dry run         : {args.dry_run}")
     print(f"Backup gamelist : {args.backup_gamelist}")
     print(f"Fuzzy match     : {args.fuzzy_media_match}")
+    print(f"Rescan media    : {args.rescan_media}")
     print(f"Report mode     : {args.report}")
     print("=====================")
 
@@ -677,6 +909,7 @@ def main() -> int:
             dry_run=args.dry_run,
             backup_gamelist_flag=args.backup_gamelist,
             fuzzy_media_match=args.fuzzy_media_match,
+            rescan_media=args.rescan_media,
             report=args.report,
             stats=stats,
         )